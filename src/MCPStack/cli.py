@@ -1,34 +1,102 @@
 import importlib
 import inspect
-import json
 import logging
 import os
 import sys
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 
 import rich.box as box
 import typer
 from beartype import beartype
-from beartype.typing import Annotated, Dict, Optional
+from beartype.typing import TYPE_CHECKING, Annotated, Dict, List, NoReturn, Optional
 from rich.cells import cell_len
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich_pyfiglet import RichFiglet
-from thefuzz import process
+from typer.core import TyperGroup
 
 from MCPStack.core.config import StackConfig
-from MCPStack.core.preset.registry import ALL_PRESETS
 from MCPStack.core.tool.cli.base import BaseToolCLI
 from MCPStack.core.utils.exceptions import MCPStackPresetError
 from MCPStack.core.utils.logging import setup_logging
-from MCPStack.stack import MCPStackCore
-from MCPStack.tools.registry import ALL_TOOLS
+from MCPStack.core.utils.serialization import load_json
+from MCPStack.core.utils.suggestions import did_you_mean
+
+if TYPE_CHECKING:
+    import MCPStack.stack
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+_HELP_FLAGS = frozenset(("--help", "-h"))
+_SEARCH_SCORE_CUTOFF = 50
+
+
+def _absolute_path(path: str) -> str:
+    """Return `os.path.abspath(path)`, skipping the `getcwd()` call when already absolute."""
+    return os.path.normpath(path) if os.path.isabs(path) else os.path.abspath(path)
+
+
+def _capture_required_env(stack: "MCPStack.stack.MCPStackCore") -> None:
+    """Copy the tools' `required_env_vars` that are set in the shell into the config.
+
+    The host launches the server with only the env written to the generated
+    config, so values that live solely in `os.environ` must be recorded there.
+    """
+    env_vars = stack.config.env_vars
+    environ = os.environ
+    for tool in stack.tools:
+        for key in getattr(tool, "required_env_vars", {}):
+            if key not in env_vars and key in environ:
+                env_vars[key] = environ[key]
+
+
+@lru_cache(maxsize=4)
+def _processed_choices(names: tuple[str, ...]) -> Dict[str, str]:
+    """Map each name to its rapidfuzz-normalized form, computed once per name set.
+
+    Callers pass a fresh `tuple(registry)` snapshot, so a preset or tool
+    registered at runtime yields a new key instead of a stale cached entry.
+    """
+    from rapidfuzz import utils
+
+    return {name: utils.default_process(name) for name in names}
+
+
+def _fuzzy_extract(
+    query: str, names: tuple[str, ...], limit: int
+) -> List[tuple[str, float]]:
+    """Return up to `limit` `(name, score)` pairs ranked by WRatio.
+
+    Choices are pre-normalized via :func:`_processed_choices`, so only the
+    query is processed on each call. Matches scoring below
+    `_SEARCH_SCORE_CUTOFF` are dropped, which lets rapidfuzz skip them early.
+    """
+    from rapidfuzz import fuzz, process, utils
+
+    processed_query = utils.default_process(query)
+    choices = _processed_choices(names)
+    if limit == 1:
+        match = process.extractOne(
+            processed_query,
+            choices,
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=_SEARCH_SCORE_CUTOFF,
+        )
+        return [(match[2], match[1])] if match else []
+    matches = process.extract(
+        processed_query,
+        choices,
+        scorer=fuzz.WRatio,
+        processor=None,
+        limit=limit,
+        score_cutoff=_SEARCH_SCORE_CUTOFF,
+    )
+    return [(name, score) for _, score, name in matches]
+
 
 @beartype
 class StackCLI:
@@ -38,6 +106,10 @@ class StackCLI:
     listing presets/tools, composing pipelines, building configs, and running
     the MCP server.
 
+    !!! note "Lazy imports"
+        The stack, registries, fuzzy matcher and tool CLIs are imported only
+        by the commands that need them, so `mcpstack --help` stays cheap.
+
     !!! tip "Completion & help"
         Use `--help` on the root and each subcommand for detailed usage and
         options. Flags shown in help mirror the method parameters below.
@@ -45,8 +117,10 @@ class StackCLI:
     Attributes:
         app (typer.Typer): Root Typer application.
         tools_app (typer.Typer): Sub-application mounted under `tools` for
-            tool-specific subcommands, if provided by a tool.
-        tool_clis (dict[str, typer.Typer]): Loaded tool CLI apps by tool name.
+            tool-specific subcommands, if provided by a tool. Tool CLIs are
+            mounted on first lookup (see :class:`_LazyToolsGroup`).
+        tool_clis (dict[str, typer.Typer]): Tool CLI apps by tool name, loaded
+            on first access.
 
     Examples:
         ```bash
@@ -82,12 +156,13 @@ class StackCLI:
         )
         self.app.command(help="Search presets/tools.")(self.search)
 
-        # Tool-specific subcommands (loaded if a tool provides a CLI module)
-        self.tools_app: typer.Typer = typer.Typer(help="Tool-specific commands.")
+        # Tool-specific subcommands (imported only once `tools` is dispatched)
+        self.tools_app: typer.Typer = typer.Typer(
+            cls=_LazyToolsGroup, help="Tool-specific commands."
+        )
         self.app.add_typer(
             self.tools_app, name="tools", help="Tool-specific subcommands."
         )
-        self.tool_clis = self._load_tool_clis()
 
     def __call__(self) -> None:
         self.app()
@@ -145,6 +220,8 @@ class StackCLI:
         !!! tip "Where do presets come from?"
             Presets are discovered from :mod:`MCPStack.core.preset.registry`.
         """
+        from MCPStack.core.preset.registry import ALL_PRESETS
+
         console.print("[bold green]💬 Available Presets[/bold green]")
         table = Table(title="")
         table.add_column("Preset", style="cyan")
@@ -163,6 +240,8 @@ class StackCLI:
         !!! note "Discovery"
             Tools are sourced from :mod:`MCPStack.tools.registry`.
         """
+        from MCPStack.tools.registry import ALL_TOOLS
+
         console.print("[bold green]💬 Available Tools[/bold green]")
         table = Table(title="")
         table.add_column("Tool", style="cyan")
@@ -233,35 +312,7 @@ class StackCLI:
         """
         console.print("[bold green]💬 Starting MCPStack run...[/bold green]")
         try:
-            if pipeline and config_path:
-                raise ValueError("Cannot specify both --pipeline and --config-path.")
-            config = StackConfig(env_vars=os.environ.copy())
-            _config_path = config_path or pipeline or "mcpstack_pipeline.json"
-            _config_path = os.path.abspath(_config_path)
-            if pipeline:
-                console.print(
-                    f"[bold green]💬 Loaded pipeline: {pipeline}[/bold green]"
-                )
-                stack = MCPStackCore.load(pipeline)
-            else:
-                stack = MCPStackCore(config=config)
-                preset_list = [p.strip() for p in presets.split(",")] if presets else []
-                for preset in preset_list:
-                    if preset not in ALL_PRESETS:
-                        available_presets = list(ALL_PRESETS.keys())
-                        best_match, score = process.extractOne(
-                            preset, available_presets
-                        ) or (None, 0)
-                        suggestion_text = (
-                            f" Did you mean '{best_match}'?" if score >= 80 else ""
-                        )
-                        raise MCPStackPresetError(
-                            f"Unknown preset: {preset}.{suggestion_text}"
-                        )
-                    console.print(
-                        f"[bold green]💬 Applying preset '{preset}'...[/bold green]"
-                    )
-                    stack = stack.with_preset(preset)
+            stack, _config_path = self._resolve_stack(pipeline, presets, config_path)
             console.print(
                 f"[bold green]💬 Building with config type '{config_type}'...[/bold green]"
             )
@@ -282,9 +333,7 @@ class StackCLI:
             console.print("[bold green]💬 Starting MCP server...[/bold green]")
             stack.run()
         except Exception as e:
-            logger.error(f"Run failed: {e}", exc_info=True)
-            console.print(f"[red]❌ Error: {e}[/red]")
-            raise typer.Exit(code=1) from e
+            self._report(e, "Run")
 
     def build(
         self,
@@ -352,36 +401,8 @@ class StackCLI:
         """
         console.print("[bold green]💬 Starting MCPStack build...[/bold green]")
         try:
-            if pipeline and config_path:
-                raise ValueError("Cannot specify both --pipeline and --config-path.")
-            config = StackConfig(env_vars=os.environ.copy())
-            _config_path = config_path or pipeline or "mcpstack_pipeline.json"
-            _config_path = os.path.abspath(_config_path)
-            if pipeline:
-                console.print(
-                    f"[bold green]💬 Loaded pipeline: {pipeline}[/bold green]"
-                )
-                stack = MCPStackCore.load(pipeline)
-            else:
-                stack = MCPStackCore(config=config)
-                preset_list = [p.strip() for p in presets.split(",")] if presets else []
-                for preset in preset_list:
-                    if preset not in ALL_PRESETS:
-                        available_presets = list(ALL_PRESETS.keys())
-                        best_match, score = process.extractOne(
-                            preset, available_presets
-                        ) or (None, 0)
-                        suggestion_text = (
-                            f" Did you mean '{best_match}'?" if score >= 80 else ""
-                        )
-                        raise MCPStackPresetError(
-                            f"Unknown preset: {preset}.{suggestion_text}"
-                        )
-                    console.print(
-                        f"[bold green]💬 Applying preset '{preset}'...[/bold green]"
-                    )
-                    stack = stack.with_preset(preset)
-            _save_path = os.path.abspath(output) if output else None
+            stack, _config_path = self._resolve_stack(pipeline, presets, config_path)
+            _save_path = _absolute_path(output) if output else None
             console.print(
                 f"[bold green]💬 Building with config type '{config_type}'...[/bold green]"
             )
@@ -398,9 +419,7 @@ class StackCLI:
             stack.save(_config_path)
             console.print("[bold green]💬 ✅ Pipeline config saved.[/bold green]")
         except Exception as e:
-            logger.error(f"Build failed: {e}", exc_info=True)
-            console.print(f"[red]❌ Error: {e}[/red]")
-            raise typer.Exit(code=1) from e
+            self._report(e, "Build")
 
     def pipeline(
         self,
@@ -437,19 +456,19 @@ class StackCLI:
             If `tool_name` is not in the registry, the command suggests the
             closest match and exits with an error.
         """
+        from MCPStack.stack import MCPStackCore
+        from MCPStack.tools.registry import ALL_TOOLS
+
         console.print(
             f"[bold green]💬 Adding tool '{tool_name}' to pipeline...[/bold green]"
         )
         if tool_name not in ALL_TOOLS:
-            available = list(ALL_TOOLS.keys())
-            best_match, score = process.extractOne(tool_name, available) or (None, 0)
-            suggestion_text = f" Did you mean '{best_match}'?" if score >= 80 else ""
+            suggestion_text = did_you_mean(tool_name, ALL_TOOLS.keys())
             console.print(f"[red]❌ Unknown tool: {tool_name}.{suggestion_text}[/red]")
             raise typer.Exit(code=1)
         try:
             if tool_config:
-                with open(tool_config) as f:
-                    tool_dict = json.load(f)
+                tool_dict = load_json(tool_config)
             else:
                 tool_dict = {"env_vars": {}, "tool_params": {}}
             pipeline_path = to_pipeline or new_pipeline
@@ -491,7 +510,8 @@ class StackCLI:
             limit: Maximum number of matches to show for each domain.
 
         Output:
-            Prints category tables with matches and scores.
+            Prints category tables with matches and scores. Matches scoring
+            below 50 are omitted.
 
         !!! tip "Partial names welcome"
             Short fragments are fine; results are ranked by fuzzy score.
@@ -502,119 +522,93 @@ class StackCLI:
                 "[red]❌ Invalid type. Use `presets`, `tools`, or `both`.[/red]"
             )
             raise typer.Exit(code=1)
+        from MCPStack.core.preset.registry import ALL_PRESETS
+        from MCPStack.tools.registry import ALL_TOOLS
+
         results = []
         if type_ in ["presets", "both"]:
-            presets = list(ALL_PRESETS.keys())
-            from thefuzz import process as _p
-
-            preset_matches = _p.extract(query, presets, limit=limit)
+            preset_matches = _fuzzy_extract(query, tuple(ALL_PRESETS), limit=limit)
             results.append(("Presets", preset_matches))
         if type_ in ["tools", "both"]:
-            tools = list(ALL_TOOLS.keys())
-            from thefuzz import process as _p
-
-            tool_matches = _p.extract(query, tools, limit=limit)
+            tool_matches = _fuzzy_extract(query, tuple(ALL_TOOLS), limit=limit)
             results.append(("Tools", tool_matches))
         for category, matches in results:
             table = Table(title=f"[bold green]💬 {category} matches[/bold green]")
             table.add_column("Match", style="cyan")
             table.add_column("Score", style="magenta")
             for match, score in matches:
-                table.add_row(str(match), str(score))
+                table.add_row(str(match), str(round(score)))
+            if not matches:
+                table.add_row("[dim]— no matches —[/dim]", "")
             console.print(table)
 
-    def _load_tool_clis(self) -> Dict[str, typer.Typer]:
-        """Discover and mount tool CLIs under `mcpstack tools`."""
-        tool_clis: Dict[str, typer.Typer] = {}
+    @staticmethod
+    def _resolve_stack(
+        pipeline: Optional[str], presets: Optional[str], config_path: Optional[str]
+    ) -> tuple["MCPStack.stack.MCPStackCore", str]:
+        """Load or compose the stack shared by `run` and `build`.
 
-        for tool_name in ALL_TOOLS:
-            if app := self._load_tool_cli(tool_name):
-                tool_clis[tool_name] = app
-                self.tools_app.add_typer(
-                    app, name=tool_name, help=f"{tool_name} tool commands."
-                )
-            else:
-                logger.debug("No CLI found for tool '%s'", tool_name)
+        Args:
+            pipeline: Existing pipeline JSON to load, if any.
+            presets: Comma-separated preset names (ignored with `pipeline`).
+            config_path: Where the pipeline JSON should be saved.
 
-        return tool_clis
+        Returns:
+            tuple[MCPStackCore, str]: The stack and the absolute pipeline path.
+
+        Raises:
+            ValueError: If both `pipeline` and `config_path` are given.
+            MCPStackPresetError: If a preset name is unknown.
+        """
+        from MCPStack.core.preset.registry import ALL_PRESETS
+        from MCPStack.stack import MCPStackCore
+
+        if pipeline and config_path:
+            raise ValueError("Cannot specify both --pipeline and --config-path.")
+        _config_path = _absolute_path(
+            config_path or pipeline or "mcpstack_pipeline.json"
+        )
+        if pipeline:
+            console.print(f"[bold green]💬 Loaded pipeline: {pipeline}[/bold green]")
+            return MCPStackCore.load(pipeline), _config_path
+        stack = MCPStackCore(config=StackConfig())
+        preset_list = [p.strip() for p in presets.split(",")] if presets else []
+        # Exact lookups first; only an unknown name pays for fuzzy matching.
+        unknown = next((p for p in preset_list if p not in ALL_PRESETS), None)
+        if unknown is not None:
+            suggestion_text = did_you_mean(unknown, ALL_PRESETS.keys())
+            raise MCPStackPresetError(f"Unknown preset: {unknown}.{suggestion_text}")
+        for preset in preset_list:
+            console.print(f"[bold green]💬 Applying preset '{preset}'...[/bold green]")
+            stack = stack.with_preset(preset)
+        _capture_required_env(stack)
+        return stack, _config_path
 
     @staticmethod
-    def _load_tool_cli(tool_name: str):
-        """Return a Typer app for a tool CLI, either internal or external"""
-        try:
-            from importlib.metadata import entry_points
-
-            eps = entry_points().select(group="mcpstack.tool_clis")
-            for ep in eps:
-                if ep.name.lower() != tool_name.lower():
-                    continue
-                obj = ep.load()
-                app = _materialize_cli_app(obj)
-                if app:
-                    return app
-        except Exception as e:
-            logger.debug(
-                "Entry point CLI load failed for '%s': %s", tool_name, e, exc_info=True
-            )
+    def _report(exc: Exception, action: str) -> NoReturn:
+        """Log and print a failed `action`, then exit with code 1."""
+        logger.error(f"{action} failed: {exc}", exc_info=True)
+        console.print(f"[red]❌ Error: {exc}[/red]")
+        raise typer.Exit(code=1) from exc
 
-        try:
-            module = importlib.import_module(f"MCPStack.tools.{tool_name}.cli")
-            # Prefer a BaseToolCLI subclass, else a top-level get_app(), else a Typer app
-            for _, cls in inspect.getmembers(module, inspect.isclass):
-                if issubclass(cls, BaseToolCLI) and cls is not BaseToolCLI:
-                    app = cls.get_app()
-                    if app:
-                        return app
-            get_app = getattr(module, "get_app", None)
-            if callable(get_app):
-                return get_app()
-        except ModuleNotFoundError:
-            return None
-        except Exception as e:
-            logger.debug(
-                "Built-in CLI load failed for '%s': %s", tool_name, e, exc_info=True
-            )
+    @cached_property
+    def tool_clis(self) -> Dict[str, typer.Typer]:
+        """Tool CLI apps by tool name, loaded on first access."""
+        return self._load_tool_clis()
 
-        return None
+    def _load_tool_clis(self) -> Dict[str, typer.Typer]:
+        """Discover the CLI app of every registered tool that provides one."""
+        from MCPStack.tools.registry import ALL_TOOLS
 
-    @staticmethod
-    def _get_tool_cli_class(tool_name: str):
-        """Return the BaseToolCLI subclass for a tool (if provided as a class).
+        tool_clis: Dict[str, typer.Typer] = {}
 
-        Supports:
-          * Entry point 'mcpstack.tool_clis' (object must be a BaseToolCLI subclass)
-          * MCPStack.tools.<tool_name>.cli (first-party fallback)
+        for tool_name in ALL_TOOLS:
+            if app := _load_tool_cli(tool_name):
+                tool_clis[tool_name] = app
+            else:
+                logger.debug("No CLI found for tool '%s'", tool_name)
 
-        If the CLI is exposed only as a callable / app, this accessor will not apply.
-        """
-        try:
-            from importlib.metadata import entry_points
-
-            eps = entry_points().select(group="mcpstack.tool_clis")
-            for ep in eps:
-                if ep.name.lower() != tool_name.lower():
-                    continue
-                obj = ep.load()
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, BaseToolCLI)
-                    and obj is not BaseToolCLI
-                ):
-                    return obj
-        except Exception:
-            pass
-
-        module = importlib.import_module(f"MCPStack.tools.{tool_name}.cli")
-        tool_cli_classes = [
-            obj
-            for _, obj in inspect.getmembers(module)
-            if inspect.isclass(obj)
-            and issubclass(obj, BaseToolCLI)
-            and obj is not BaseToolCLI
-        ]
-        if not tool_cli_classes:
-            raise RuntimeError(f"No CLI class found for '{tool_name}'.")
-        return tool_cli_classes[0]
+        return tool_clis
 
     def _status(self, tool: Optional[str] = None, verbose: bool = False) -> None:
         """Render a status panel for a tool, showing env and configuration.
@@ -628,10 +622,10 @@ class StackCLI:
             Relies on each tool CLI's `status()` implementation to render.
         """
         console.print("[bold green]💬 Checking status...[/bold green]")
-        tools_to_check = [tool] if tool else list(self._load_tool_clis().keys())
+        tools_to_check = [tool] if tool else list(self.tool_clis)
         for _tool in tools_to_check:
             try:
-                tool_cli_class = self._get_tool_cli_class(_tool)
+                tool_cli_class = _get_tool_cli_class(_tool)
                 tool_cli_class.status(verbose=verbose)
             except Exception as e:
                 logger.debug(f"Status not available for '{_tool}': {e}")
@@ -648,51 +642,179 @@ class StackCLI:
             The banner is only displayed on help screens to avoid noisy output
             during normal command execution.
         """
+        if _HELP_FLAGS.isdisjoint(sys.argv):
+            return
+        from rich_pyfiglet import RichFiglet
+
         from MCPStack import __version__
 
-        if any(arg in sys.argv for arg in ["--help", "-h"]):
-            rich_fig = RichFiglet(
-                "MCPStack",
-                font="ansi_shadow",
-                colors=["#0ea5e9", "#0ea5e9", "#0ea5e9", "#FFFFFF", "#FFFFFF"],
-                horizontal=True,
-                remove_blank_lines=True,
-            )
-            entries = [
-                ("🏗️", " Project", "MCPStack — Modular MCP Pipelines"),
-                ("🏎️", " Version", __version__),
-            ]
-            max_label_len = max(
-                cell_len(emoji + " " + key + ":") for emoji, key, value in entries
-            )
-            group_items = [
-                Text(""),
-                Text(""),
-                rich_fig,
-                Text(""),
-                Text("Composable MCP pipelines."),
-                Text(""),
-            ]
-            for i, (emoji, key, value) in enumerate(entries):
-                label_plain = emoji + " " + key + ":"
-                label_len = cell_len(label_plain)
-                spaces = " " * (max_label_len - label_len + 2)
-                line = f"[turquoise4]{label_plain}[/turquoise4]{spaces}{value}"
-                group_items.append(Text.from_markup(line))
-                if i == 0:
-                    group_items.append(Text(""))
-            group_items += [Text(""), Text("")]
-            console.print(
-                Panel(
-                    Group(*group_items),
-                    title="MCPStack CLI",
-                    width=80,
-                    title_align="left",
-                    expand=False,
-                    box=box.ROUNDED,
-                    padding=(1, 5),
-                )
+        rich_fig = RichFiglet(
+            "MCPStack",
+            font="ansi_shadow",
+            colors=["#0ea5e9", "#0ea5e9", "#0ea5e9", "#FFFFFF", "#FFFFFF"],
+            horizontal=True,
+            remove_blank_lines=True,
+        )
+        entries = [
+            ("🏗️", " Project", "MCPStack — Modular MCP Pipelines"),
+            ("🏎️", " Version", __version__),
+        ]
+        max_label_len = max(
+            cell_len(emoji + " " + key + ":") for emoji, key, value in entries
+        )
+        group_items = [
+            Text(""),
+            Text(""),
+            rich_fig,
+            Text(""),
+            Text("Composable MCP pipelines."),
+            Text(""),
+        ]
+        for i, (emoji, key, value) in enumerate(entries):
+            label_plain = emoji + " " + key + ":"
+            label_len = cell_len(label_plain)
+            spaces = " " * (max_label_len - label_len + 2)
+            line = f"[turquoise4]{label_plain}[/turquoise4]{spaces}{value}"
+            group_items.append(Text.from_markup(line))
+            if i == 0:
+                group_items.append(Text(""))
+        group_items += [Text(""), Text("")]
+        console.print(
+            Panel(
+                Group(*group_items),
+                title="MCPStack CLI",
+                width=80,
+                title_align="left",
+                expand=False,
+                box=box.ROUNDED,
+                padding=(1, 5),
             )
+        )
+
+
+class _LazyToolsGroup(TyperGroup):
+    """Click group for `mcpstack tools` that mounts tool CLIs on demand.
+
+    Tool CLIs are imported only when a tool subcommand is looked up (or when
+    `mcpstack tools --help` lists them), instead of at `StackCLI` construction.
+    """
+
+    def list_commands(self, ctx) -> List[str]:
+        from MCPStack.tools.registry import ALL_TOOLS
+
+        names = super().list_commands(ctx)
+        for tool_name in ALL_TOOLS:
+            if tool_name not in names and self.get_command(ctx, tool_name):
+                names.append(tool_name)
+        return names
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        from MCPStack.tools.registry import ALL_TOOLS
+
+        if cmd_name not in ALL_TOOLS:
+            return None
+        app = _load_tool_cli(cmd_name)
+        if app is None:
+            logger.debug("No CLI found for tool '%s'", cmd_name)
+            return None
+        wrapper = typer.Typer()
+        wrapper.add_typer(app, name=cmd_name, help=f"{cmd_name} tool commands.")
+        command = typer.main.get_group(wrapper).commands[cmd_name]
+        self.add_command(command, cmd_name)
+        return command
+
+
+@cache
+def _import_tool_cli_module(tool_name: str):
+    """Import (once) the first-party CLI module `MCPStack.tools.<tool_name>.cli`."""
+    return importlib.import_module(f"MCPStack.tools.{tool_name}.cli")
+
+
+@cache
+def _load_tool_cli(tool_name: str):
+    """Return a Typer app for a tool CLI, either internal or external.
+
+    Results (including "no CLI") are memoized per tool name.
+    """
+    try:
+        from importlib.metadata import entry_points
+
+        eps = entry_points().select(group="mcpstack.tool_clis")
+        for ep in eps:
+            if ep.name.lower() != tool_name.lower():
+                continue
+            obj = ep.load()
+            app = _materialize_cli_app(obj)
+            if app:
+                return app
+    except Exception as e:
+        logger.debug(
+            "Entry point CLI load failed for '%s': %s", tool_name, e, exc_info=True
+        )
+
+    try:
+        module = _import_tool_cli_module(tool_name)
+        # Prefer a BaseToolCLI subclass, else a top-level get_app(), else a Typer app
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, BaseToolCLI) and cls is not BaseToolCLI:
+                app = cls.get_app()
+                if app:
+                    return app
+        get_app = getattr(module, "get_app", None)
+        if callable(get_app):
+            return get_app()
+    except ModuleNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(
+            "Built-in CLI load failed for '%s': %s", tool_name, e, exc_info=True
+        )
+
+    return None
+
+
+@cache
+def _get_tool_cli_class(tool_name: str):
+    """Return the BaseToolCLI subclass for a tool (if provided as a class).
+
+    Supports:
+      * Entry point 'mcpstack.tool_clis' (object must be a BaseToolCLI subclass)
+      * MCPStack.tools.<tool_name>.cli (first-party fallback)
+
+    If the CLI is exposed only as a callable / app, this accessor will not apply.
+    Successful lookups are memoized per tool name.
+    """
+    try:
+        from importlib.metadata import entry_points
+
+        eps = entry_points().select(group="mcpstack.tool_clis")
+        for ep in eps:
+            if ep.name.lower() != tool_name.lower():
+                continue
+            obj = ep.load()
+            if (
+                inspect.isclass(obj)
+                and issubclass(obj, BaseToolCLI)
+                and obj is not BaseToolCLI
+            ):
+                return obj
+    except Exception:
+        pass
+
+    module = _import_tool_cli_module(tool_name)
+    tool_cli_classes = [
+        obj
+        for _, obj in inspect.getmembers(module)
+        if inspect.isclass(obj)
+        and issubclass(obj, BaseToolCLI)
+        and obj is not BaseToolCLI
+    ]
+    if not tool_cli_classes:
+        raise RuntimeError(f"No CLI class found for '{tool_name}'.")
+    return tool_cli_classes[0]
 
 
 def _materialize_cli_app(obj):
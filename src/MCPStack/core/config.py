@@ -1,9 +1,10 @@
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from beartype import beartype
-from beartype.typing import Any, Dict, List, Optional
+from beartype.typing import Any, Dict, List, Mapping, Optional
 
 from .utils.exceptions import MCPStackConfigError
 from .utils.logging import setup_logging
@@ -11,7 +12,13 @@ from .utils.logging import setup_logging
 logger = logging.getLogger(__name__)
 
 
-@beartype
+@lru_cache(maxsize=1)
+def _project_root() -> Path:
+    """Resolve the project root once per process (see `StackConfig._get_project_root`)."""
+    package_root = Path(__file__).resolve().parents[3]
+    return package_root if (package_root / "pyproject.toml").exists() else Path.home()
+
+
 class StackConfig:
     """Configuration container for MCPStack.
 
@@ -23,7 +30,8 @@ class StackConfig:
 
     Args:
         log_level: Logging level name (e.g., `"INFO"`, `"DEBUG"`).
-        env_vars: Mapping of environment variables to set/merge.
+        env_vars: Mapping of environment variables to set/merge. It is copied,
+            so later changes to the caller's mapping are not picked up.
 
     Attributes:
         log_level (str): Active logging level.
@@ -38,11 +46,12 @@ class StackConfig:
         construction via :meth:`_apply_config`.
     """
 
+    @beartype
     def __init__(
-        self, log_level: str = "INFO", env_vars: Optional[Dict[str, str]] = None
+        self, log_level: str = "INFO", env_vars: Optional[Mapping[str, str]] = None
     ) -> None:
         self.log_level = log_level
-        self.env_vars = env_vars or {}
+        self.env_vars: Dict[str, str] = dict(env_vars) if env_vars is not None else {}
         self._set_paths()
         self._apply_config()
 
@@ -61,6 +70,7 @@ class StackConfig:
         return {"log_level": self.log_level, "env_vars": self.env_vars.copy()}
 
     @classmethod
+    @beartype
     def from_dict(cls, data: Dict[str, Any]) -> "StackConfig":
         """Construct a :class:`StackConfig` from a mapping.
 
@@ -108,8 +118,10 @@ class StackConfig:
         """Ensure all tools' required environment variables are present.
 
         Inspects each tool's `required_env_vars` (a mapping of `name -> default`)
-        and verifies that values are available via :meth:`get_env_var`. When a
-        default is `None`, the key is considered **required**.
+        and verifies that values are available in `env_vars` or the process
+        environment, following the lookup order of :meth:`get_env_var`. When a
+        default is `None`, the key is considered **required**; keys with a
+        default always pass.
 
         Args:
             tools: Iterable of tool instances to validate against this config.
@@ -122,17 +134,16 @@ class StackConfig:
             * Typos in environment variable names.
             * Forgot to merge preset/tool-provided env.
         """
-        errors = []
-        for tool in tools:
-            for req_key, req_default in getattr(tool, "required_env_vars", {}).items():
-                try:
-                    self.get_env_var(
-                        req_key,
-                        default=req_default,
-                        raise_if_missing=req_default is None,
-                    )
-                except Exception as e:
-                    errors.append(f"{tool.__class__.__name__}: {e}")
+        env_vars = self.env_vars
+        environ = os.environ
+        errors = [
+            f"{tool.__class__.__name__}: Missing required env var: {req_key}"
+            for tool in tools
+            for req_key, req_default in getattr(tool, "required_env_vars", {}).items()
+            if req_default is None
+            and req_key not in env_vars
+            and req_key not in environ
+        ]
         if errors:
             raise MCPStackConfigError("\n".join(errors))
         logger.info(f"Validated config for {len(tools)} tools.")
@@ -150,6 +161,11 @@ class StackConfig:
         !!! tip "Namespacing"
             Use `prefix` (e.g., `"MYTOOL_"`) to avoid collisions between tools.
         """
+        if not prefix:
+            env_vars = self.env_vars
+            if not any(k in env_vars and env_vars[k] != v for k, v in new_env.items()):
+                env_vars.update(new_env)
+                return
         for key, value in new_env.items():
             prefixed_key = f"{prefix}{key}" if prefix else key
             if prefixed_key in self.env_vars and self.env_vars[prefixed_key] != value:
@@ -182,11 +198,11 @@ class StackConfig:
 
         !!! tip
             Useful for resolving default data directories during local dev.
+
+        !!! note
+            The lookup is cached for the lifetime of the process.
         """
-        package_root = Path(__file__).resolve().parents[3]
-        return (
-            package_root if (package_root / "pyproject.toml").exists() else Path.home()
-        )
+        return _project_root()
 
     def _get_data_dir(self) -> Path:
         """Resolve the base data directory.
@@ -208,7 +224,8 @@ class StackConfig:
 
         Side effects:
             * Initializes logging via :func:`setup_logging` using `log_level`.
-            * Writes keys from `env_vars` into `os.environ`.
+            * Writes keys from `env_vars` into `os.environ`, skipping keys that
+              already hold the same value.
 
         Raises:
             MCPStackConfigError: If the logging level is invalid.
@@ -223,4 +240,5 @@ class StackConfig:
         except Exception as e:
             raise MCPStackConfigError("Invalid log level", details=str(e)) from e
         for k, v in self.env_vars.items():
-            os.environ[k] = v
+            if os.environ.get(k) != v:
+                os.environ[k] = v
@@ -1,27 +1,36 @@
-import json
+import copy
 import logging
 import os
 import shutil
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 from beartype import beartype
-from beartype.typing import Any, Dict, List, Optional
+from beartype.typing import Any, Dict, List, Optional, Tuple, Union
 
 from MCPStack.core.utils.exceptions import MCPStackValidationError
+from MCPStack.core.utils.serialization import dump_json, dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
+# Last known `mcpServers` of each Claude config, keyed by path and trusted only
+# while the file's `(st_mtime_ns, st_size)` is unchanged.
+_SERVERS_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
 
-@beartype
 class ClaudeConfigGenerator:
     """Factory for producing an MCP host configuration JSON from a stack dedicated to ClaudeDesktop.
 
     !!! note "Deterministic"
 
         Reads from environment and `StackConfig`; does not mutate the stack.
+        The returned `env` may share the stack's `env_vars` mapping, so treat
+        the result as read-only.
     """
 
     @classmethod
+    @beartype
     def generate(
         cls,
         stack,
@@ -30,7 +39,7 @@ class ClaudeConfigGenerator:
         cwd: Optional[str] = None,
         module_name: Optional[str] = None,
         pipeline_config_path: Optional[str] = None,
-        save_path: Optional[str] = None,
+        save_path: Optional[Union[str, os.PathLike]] = None,
     ) -> Dict[str, Any]:
         """Create the configuration mapping and optionally persist it to disk.
 
@@ -45,7 +54,7 @@ class ClaudeConfigGenerator:
           cwd (str | None): Working directory for the server process.
           module_name (str | None): Python module to run when using `-m`.
           pipeline_config_path (str | None): Path to the pipeline JSON produced by `stack.save()`.
-          save_path (str | None): If set, write the config JSON here.
+          save_path (str | os.PathLike | None): If set, write the config JSON here.
 
         Returns:
           dict: Configuration mapping suitable for MCP-compatible hosts.
@@ -58,7 +67,7 @@ class ClaudeConfigGenerator:
         _args = cls._get_args(args, stack, _module_name)
         _cwd = cls._get_cwd(cwd, stack)
 
-        if not shutil.which(_command):
+        if not cls._command_exists(_command):
             raise MCPStackValidationError(
                 f"Invalid command '{_command}': Not found on PATH."
             )
@@ -67,9 +76,9 @@ class ClaudeConfigGenerator:
                 f"Invalid cwd '{_cwd}': Directory does not exist."
             )
 
-        env = stack.config.env_vars.copy()
+        env = stack.config.env_vars
         if pipeline_config_path:
-            env["MCPSTACK_CONFIG_PATH"] = pipeline_config_path
+            env = {**env, "MCPSTACK_CONFIG_PATH": pipeline_config_path}
 
         config = {
             "mcpServers": {
@@ -82,22 +91,59 @@ class ClaudeConfigGenerator:
             }
         }
         if save_path:
-            with open(save_path, "w") as f:
-                json.dump(config, f, indent=2)
+            dump_json(config, save_path)
             logger.info(f"✅ Claude config saved to {save_path}.")
         else:
             path = cls._get_claude_config_path()
-            if path:
-                existing = {}
-                if path.exists():
-                    with open(path) as f:
-                        existing = json.load(f)
-                existing.setdefault("mcpServers", {}).update(config["mcpServers"])
-                with open(path, "w") as f:
-                    json.dump(existing, f, indent=2)
+            if path and not path.exists():
+                dump_json(config, path)
+                logger.info(f"✅ Claude config saved to {path}.")
+            elif path and cls._merge_into_existing(path, config["mcpServers"]):
                 logger.info(f"✅ Claude config merged into {path}.")
+            elif path:
+                logger.info(f"✅ Claude config at {path} is already up to date.")
         return config
 
+    @staticmethod
+    def _merge_into_existing(path: Path, servers: Dict[str, Any]) -> bool:
+        """Merge `servers` into the Claude config at `path` in place.
+
+        The file is opened once for both the read and the write. The merged
+        document is fully encoded before the file is rewound and truncated,
+        so a serialization error leaves the existing config untouched.
+
+        !!! note "Cached"
+
+            The parsed `mcpServers` are remembered per path. A repeat merge
+            of identical entries into a file whose mtime and size have not
+            changed since returns without reading it again.
+
+        Returns:
+          bool: `False` if every entry already matched and nothing was written.
+        """
+        key = str(path)
+        cached = _SERVERS_CACHE.get(key)
+        if cached is not None:
+            st = path.stat()
+            if cached[:2] == (st.st_mtime_ns, st.st_size) and _servers_match(
+                cached[2], servers
+            ):
+                return False
+        with open(path, "r+b") as f:
+            existing = loads_json(f.read())
+            current = existing.get("mcpServers") or {}
+            written = not _servers_match(current, servers)
+            if written:
+                current = _merge_mcp_servers(existing, servers)
+                data = dumps_json(existing)
+                f.seek(0)
+                f.write(data)
+                f.truncate()
+                f.flush()
+            st = os.fstat(f.fileno())
+        _SERVERS_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(current))
+        return written
+
     @staticmethod
     def _get_command(command, stack) -> str:
         """Resolve `command` from explicit args, env, or sensible defaults."""
@@ -110,6 +156,13 @@ class ClaudeConfigGenerator:
         default_python = shutil.which("python") or shutil.which("python3") or "python"
         return stack.config.get_env_var("MCPSTACK_COMMAND", default_python)
 
+    @staticmethod
+    def _command_exists(command: str) -> bool:
+        """Check that `command` is runnable, skipping the `PATH` walk for absolute paths."""
+        if os.path.isabs(command):
+            return os.path.isfile(command) and os.access(command, os.X_OK)
+        return shutil.which(command) is not None
+
     @staticmethod
     def _get_module_name(module_name, stack) -> str:
         """Resolve `module_name` from explicit args, env, or sensible defaults."""
@@ -134,16 +187,45 @@ class ClaudeConfigGenerator:
         return stack.config.get_env_var("MCPSTACK_CWD", os.getcwd())
 
     @staticmethod
-    def _get_claude_config_path():
-        """_get_claude_config_path function."""
-        home = Path.home()
-        paths = [
-            home
-            / "Library"
-            / "Application Support"
-            / "Claude"
-            / "claude_desktop_config.json",
-            home / "AppData" / "Roaming" / "Claude" / "claude_desktop_config.json",
-            home / ".config" / "Claude" / "claude_desktop_config.json",
-        ]
-        return next((p for p in paths if p.parent.exists()), None)
+    def _get_claude_config_path() -> Optional[Path]:
+        """Return the Claude Desktop config path for this machine, if any.
+
+        !!! note "Cached"
+
+            The lookup is resolved once per process; see `_claude_config_path`.
+        """
+        return _claude_config_path()
+
+
+def _servers_match(current: Dict[str, Any], servers: Dict[str, Any]) -> bool:
+    """Return whether every entry in `servers` already appears in `current`."""
+    return all(current.get(name) == entry for name, entry in servers.items())
+
+
+def _merge_mcp_servers(
+    existing: Dict[str, Any], servers: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge `servers` into `existing["mcpServers"]` and return the result."""
+    current = existing.get("mcpServers")
+    if current is None:
+        current = existing["mcpServers"] = dict(servers)
+    else:
+        current.update(servers)
+    return current
+
+
+@lru_cache(maxsize=1)
+def _claude_config_path() -> Optional[Path]:
+    """Locate the Claude Desktop config for the current platform.
+
+    Only the platform's own location is checked, and it is returned only if
+    its parent directory exists.
+    """
+    if sys.platform == "darwin":
+        relative = "Library/Application Support/Claude/claude_desktop_config.json"
+    elif sys.platform == "win32":
+        relative = "AppData/Roaming/Claude/claude_desktop_config.json"
+    else:
+        relative = ".config/Claude/claude_desktop_config.json"
+    path = Path.home() / relative
+    return path if path.parent.exists() else None
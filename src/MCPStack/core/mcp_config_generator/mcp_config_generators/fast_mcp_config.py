@@ -1,27 +1,29 @@
-import json
 import logging
 import os
 import shutil
 from pathlib import Path
 
 from beartype import beartype
-from beartype.typing import Any, Dict, List, Optional
+from beartype.typing import Any, Dict, List, Optional, Union
 
 from MCPStack.core.utils.exceptions import MCPStackValidationError
+from MCPStack.core.utils.serialization import dump_json
 
 logger = logging.getLogger(__name__)
 
 
-@beartype
 class FastMCPConfigGenerator:
     """Factory for producing an MCP host configuration JSON from a stack dedicated to FastMCP.
 
     !!! note "Deterministic"
 
         Reads from environment and `StackConfig`; does not mutate the stack.
+        The returned `env` may share the stack's `env_vars` mapping, so treat
+        the result as read-only.
     """
 
     @classmethod
+    @beartype
     def generate(
         cls,
         stack,
@@ -30,7 +32,7 @@ class FastMCPConfigGenerator:
         cwd: Optional[str] = None,
         module_name: Optional[str] = None,
         pipeline_config_path: Optional[str] = None,
-        save_path: Optional[str] = None,
+        save_path: Optional[Union[str, os.PathLike]] = None,
     ) -> Dict[str, Any]:
         """Create the configuration mapping and optionally persist it to disk.
 
@@ -45,7 +47,7 @@ class FastMCPConfigGenerator:
           cwd (str | None): Working directory for the server process.
           module_name (str | None): Python module to run when using `-m`.
           pipeline_config_path (str | None): Path to the pipeline JSON produced by `stack.save()`.
-          save_path (str | None): If set, write the config JSON here.
+          save_path (str | os.PathLike | None): If set, write the config JSON here.
 
         Returns:
           dict: Configuration mapping suitable for MCP-compatible hosts.
@@ -58,7 +60,7 @@ class FastMCPConfigGenerator:
         _args = cls._get_args(args, stack, _module_name)
         _cwd = cls._get_cwd(cwd, stack)
 
-        if not shutil.which(_command):
+        if not cls._command_exists(_command):
             raise MCPStackValidationError(
                 f"Invalid command '{_command}': Not found on PATH."
             )
@@ -67,9 +69,9 @@ class FastMCPConfigGenerator:
                 f"Invalid cwd '{_cwd}': Directory does not exist."
             )
 
-        env = stack.config.env_vars.copy()
+        env = stack.config.env_vars
         if pipeline_config_path:
-            env["MCPSTACK_CONFIG_PATH"] = pipeline_config_path
+            env = {**env, "MCPSTACK_CONFIG_PATH": pipeline_config_path}
 
         config = {
             "mcpServers": {
@@ -82,8 +84,7 @@ class FastMCPConfigGenerator:
             }
         }
         if save_path:
-            with open(save_path, "w") as f:
-                json.dump(config, f, indent=2)
+            dump_json(config, save_path)
             logger.info(f"✅ FastMCP config saved to {save_path}.")
         return config
 
@@ -99,6 +100,13 @@ class FastMCPConfigGenerator:
         default_python = shutil.which("python") or shutil.which("python3") or "python"
         return stack.config.get_env_var("MCPSTACK_COMMAND", default_python)
 
+    @staticmethod
+    def _command_exists(command: str) -> bool:
+        """Check that `command` is runnable, skipping the `PATH` walk for absolute paths."""
+        if os.path.isabs(command):
+            return os.path.isfile(command) and os.access(command, os.X_OK)
+        return shutil.which(command) is not None
+
     @staticmethod
     def _get_module_name(module_name, stack) -> str:
         """Resolve `module_name` from explicit args, env, or sensible defaults."""
@@ -1,22 +1,26 @@
-import json
 import logging
+import os
 
 from beartype import beartype
-from beartype.typing import List, Optional
+from beartype.typing import List, Optional, Union
+
+from MCPStack.core.utils.serialization import dump_json
 
 logger = logging.getLogger(__name__)
 
 
-@beartype
 class UniversalConfigGenerator:
     """Factory for producing an MCP host configuration JSON from a stack, dedicated to universal applications.
 
     !!! note "Deterministic"
 
         Reads from environment and `StackConfig`; does not mutate the stack.
+        The returned `env_vars` may share the stack's `env_vars` mapping, so
+        treat the result as read-only.
     """
 
     @classmethod
+    @beartype
     def generate(
         cls,
         stack,
@@ -25,7 +29,7 @@ class UniversalConfigGenerator:
         cwd: Optional[str] = None,
         module_name: Optional[str] = None,
         pipeline_config_path: Optional[str] = None,
-        save_path: Optional[str] = None,
+        save_path: Optional[Union[str, os.PathLike]] = None,
     ) -> dict:
         """Create the configuration mapping and optionally persist it to disk.
 
@@ -40,21 +44,29 @@ class UniversalConfigGenerator:
           cwd (str | None): Working directory for the server process.
           module_name (str | None): Python module to run when using `-m`.
           pipeline_config_path (str | None): Path to the pipeline JSON produced by `stack.save()`.
-          save_path (str | None): If set, write the config JSON here.
+          save_path (str | os.PathLike | None): If set, write the config JSON here.
 
         Returns:
-          dict: Configuration mapping suitable for MCP-compatible hosts.
+          dict: Configuration mapping suitable for MCP-compatible hosts, with
+            the stack's `config` and `tools` in the same shape `stack.save()`
+            writes, plus the resolved `env_vars`. Runtime handles such as the
+            FastMCP server are not included.
 
         Raises:
           MCPStackValidationError: If `command` or `cwd` are invalid (FastMCP variant).
         """
-        env = stack.config.env_vars.copy()
+        env = stack.config.env_vars
         if pipeline_config_path:
-            env["MCPSTACK_CONFIG_PATH"] = pipeline_config_path
-        config = stack.__dict__.copy()
-        config["env_vars"] = env
+            env = {**env, "MCPSTACK_CONFIG_PATH": pipeline_config_path}
+        config = {
+            "config": stack.config.to_dict(),
+            "tools": [
+                {"type": tool.__class__.__name__.lower(), "params": tool.to_dict()}
+                for tool in stack.tools
+            ],
+            "env_vars": env,
+        }
         if save_path:
-            with open(save_path, "w") as f:
-                json.dump(config, f, indent=2)
+            dump_json(config, save_path)
             logger.info(f"✅ Universal config saved to {save_path}.")
         return config
@@ -15,6 +15,6 @@ class ExamplePreset(Preset):
         cls, config: StackConfig | None = None, **kwargs: dict
     ) -> "MCPStack.stack.MCPStackCore":
         """ "create function."""
-        stack = MCPStackCore(config=config or StackConfig())
+        stack = MCPStackCore(config=config if config is not None else StackConfig())
         tool = Hello_World()
         return stack.with_tool(tool)
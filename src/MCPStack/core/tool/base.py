@@ -111,6 +111,11 @@ class BaseTool(ABC):
                 return {"table": table, "columns": [...], "primary_key": "id"}
             ```
 
+        !!! tip "Expensive discovery"
+            If building this list is costly (e.g. reflecting over methods),
+            compute it once and store it on `self._cached_actions`; MCPStack
+            uses that list instead of calling `actions()` when it is set.
+
         Returns:
             list[Callable]: The MCP-exposed actions in this tool.
         """
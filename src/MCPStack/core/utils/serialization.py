@@ -0,0 +1,107 @@
+import json
+import os
+import secrets
+import shutil
+
+from beartype.typing import Any, Dict, Iterable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def dumps_json(obj: Any, indent: int = 2) -> bytes:
+    """Serialize `obj` to UTF-8 encoded JSON bytes.
+
+    Uses `orjson` when installed and `indent == 2` (its only supported
+    indentation), otherwise the standard library `json` module. Non-ASCII
+    text is kept as-is rather than escaped, and non-`str` dict keys are
+    stringified by both backends (`{1: "x"}` -> `{"1": "x"}`).
+    """
+    if orjson is not None and indent == 2:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or text.
+
+    Uses `orjson` when installed (`pip install mcpstack[speedups]`), otherwise
+    the standard library `json` module. Both raise a `json.JSONDecodeError`
+    subclass on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json(obj: Any, path: Union[str, os.PathLike], indent: int = 2) -> None:
+    """Serialize `obj` to JSON and write it to `path` in a single call.
+
+    The payload is encoded in memory first with `dumps_json`, then written at
+    once instead of `json.dump`'s token-by-token writes.
+    """
+    data = dumps_json(obj, indent=indent)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def dump_json_streamed(
+    path: Union[str, os.PathLike],
+    fields: Dict[str, Any],
+    array_key: str,
+    items: Iterable[Any],
+) -> None:
+    """Write `{**fields, array_key: [*items]}` to `path`, one item at a time.
+
+    Produces the same bytes as `dump_json` with the default indentation, but
+    only one encoded item is held in memory at a time, so `items` can be a
+    generator over large payloads.
+
+    !!! note "Atomic replace"
+        Output goes to a temporary sibling of `path` that is moved over
+        `path` with `os.replace` only once every item has been written. If
+        `items` raises partway through, an existing file is left untouched.
+        Symlinks are resolved first, so the link survives and its target is
+        updated, and an existing file's permission bits are carried over.
+
+    !!! note "Indentation"
+        Each piece is encoded with `dumps_json` and re-indented by replacing
+        newlines; JSON escapes newlines inside strings, so this is safe.
+    """
+
+    def _nested(data: bytes, depth: int) -> bytes:
+        return data.replace(b"\n", b"\n" + b"  " * depth)
+
+    target = os.path.realpath(path)
+    tmp_path = f"{target}.{secrets.token_hex(4)}.tmp"
+    try:
+        with open(tmp_path, "xb") as f:
+            f.write(b"{")
+            for key, value in fields.items():
+                f.write(
+                    b"\n  " + dumps_json(key) + b": " + _nested(dumps_json(value), 1)
+                )
+                f.write(b",")
+            f.write(b"\n  " + dumps_json(array_key) + b": [")
+            empty = True
+            for item in items:
+                f.write(
+                    (b"\n    " if empty else b",\n    ") + _nested(dumps_json(item), 2)
+                )
+                empty = False
+            f.write(b"]\n}" if empty else b"\n  ]\n}")
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_json(path: Union[str, os.PathLike]) -> Any:
+    """Read and parse a JSON file with `loads_json`."""
+    with open(path, "rb") as f:
+        return loads_json(f.read())
@@ -0,0 +1,37 @@
+from beartype.typing import Collection
+
+
+def did_you_mean(name: str, available: Collection[str]) -> str:
+    """Return a `Did you mean ...?` hint for `name`, or `""` if nothing is close.
+
+    A cheap prefix check runs first (`"fastmc"` -> `"fastmcp"`); the fuzzy
+    scorer is only consulted when that fails, and discards matches scoring
+    below 80. `available` is iterated in place (pass a registry's `.keys()`
+    view), so no key list is built.
+
+    Shared by the CLI and :class:`MCPStackCore` so a typo gets the same hint
+    from `mcpstack run --presets ...` and from `with_preset(...)`.
+    """
+    if not name or not available:
+        return ""
+    lowered = name.lower()
+    cheap = next(
+        (
+            k
+            for k in available
+            if k.lower().startswith(lowered) or lowered.startswith(k.lower())
+        ),
+        None,
+    )
+    if cheap is not None:
+        return f" Did you mean '{cheap}'?"
+    from rapidfuzz import fuzz, process, utils
+
+    match = process.extractOne(
+        name,
+        available,
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+        score_cutoff=80,
+    )
+    return f" Did you mean '{match[0]}'?" if match else ""
@@ -1,11 +1,9 @@
-import json
 import logging
 import os
+from itertools import chain
 
 from beartype import beartype
 from beartype.typing import Any, List, Optional, Union
-from fastmcp import FastMCP
-from thefuzz import process
 
 from MCPStack.core.config import StackConfig
 from MCPStack.core.mcp_config_generator.registry import ALL_MCP_CONFIG_GENERATORS
@@ -16,12 +14,12 @@ from MCPStack.core.utils.exceptions import (
     MCPStackPresetError,
     MCPStackValidationError,
 )
-from MCPStack.tools.registry import ALL_TOOLS
+from MCPStack.core.utils.serialization import dump_json_streamed, load_json
+from MCPStack.core.utils.suggestions import did_you_mean
 
 logger = logging.getLogger(__name__)
 
 
-@beartype
 class MCPStackCore:
     """Composable, chainable core for building and running MCPStack MCP tool pipelines.
 
@@ -61,10 +59,27 @@ class MCPStackCore:
         # Optionally start serving (may block depending on host)
         # stack.run()
         ```
+
+    !!! note "Slots"
+        Instances use `__slots__`, so ad-hoc attributes cannot be set on a
+        stack; every fluent step allocates a small object with no `__dict__`.
     """
 
+    __slots__ = (
+        "_built",
+        "_mcp_config_generators",
+        "_registered_actions",
+        "_tool_chain",
+        "_tools",
+        "config",
+        "mcp",
+    )
+
+    @beartype
     def __init__(
-        self, config: Optional[StackConfig] = None, mcp: Optional[FastMCP] = None
+        self,
+        config: Optional[StackConfig] = None,
+        mcp: Optional["fastmcp.FastMCP"] = None,
     ) -> None:
         """Initialize an empty MCP stack.
 
@@ -79,11 +94,49 @@ class MCPStackCore:
             lazily.
         """
         self.config = config or StackConfig()
-        self.tools: list[BaseTool] = []
+        self._tools: Optional[list[BaseTool]] = []
+        self._tool_chain: Optional[tuple] = None
         self.mcp = mcp
         self._mcp_config_generators = ALL_MCP_CONFIG_GENERATORS
+        self._registered_actions: set = set()
         self._built = False
 
+    @property
+    def tools(self) -> list[BaseTool]:
+        """Tools staged for initialization/registration, in insertion order.
+
+        !!! note "Structural sharing"
+            `with_tool` / `with_tools` / `with_config` link the new stack to
+            the previous one's tools instead of copying them, so a long fluent
+            chain costs O(1) per step. The list is materialized (once) the
+            first time it is read.
+        """
+        if self._tools is None:
+            segments = []
+            node = self._tool_chain
+            while node is not None:
+                node, segment = node
+                segments.append(segment)
+            self._tools = [tool for segment in reversed(segments) for tool in segment]
+            self._tool_chain = None
+        return self._tools
+
+    @tools.setter
+    def tools(self, tools: list[BaseTool]) -> None:
+        self._tools = tools
+        self._tool_chain = None
+
+    def _extend_tools(self, tools: tuple) -> "MCPStackCore":
+        """Return a new stack sharing this stack's tools, followed by `tools`."""
+        new = MCPStackCore(config=self.config, mcp=self.mcp)
+        if self._tools is None:
+            base = self._tool_chain
+        else:
+            base = (None, tuple(self._tools)) if self._tools else None
+        new._tools = None
+        new._tool_chain = (base, tools) if tools else base
+        return new
+
     def with_config(self, config: StackConfig) -> "MCPStackCore":
         """Return a new stack using the provided configuration.
 
@@ -99,8 +152,8 @@ class MCPStackCore:
         !!! tip "Apply early"
             If tools depend on env vars or paths, call this before adding them.
         """
-        new = MCPStackCore(config=config, mcp=self.mcp)
-        new.tools = self.tools[:]
+        new = self._extend_tools(())
+        new.config = config
         return new
 
     def with_tool(self, tool: BaseTool) -> "MCPStackCore":
@@ -119,9 +172,7 @@ class MCPStackCore:
             Many toolchains assume earlier tools register primitives consumed
             by later tools. Add in dependency order.
         """
-        new = MCPStackCore(config=self.config, mcp=self.mcp)
-        new.tools = [*self.tools, tool]
-        return new
+        return self._extend_tools((tool,))
 
     def with_tools(self, tools: List[BaseTool]) -> "MCPStackCore":
         """Return a new stack with multiple tools appended.
@@ -132,10 +183,9 @@ class MCPStackCore:
         Returns:
             MCPStackCore: New stack instance with the tools appended.
         """
-        new = MCPStackCore(config=self.config, mcp=self.mcp)
-        new.tools = self.tools + tools
-        return new
+        return self._extend_tools(tuple(tools))
 
+    @beartype
     def with_preset(self, preset_name: str, **kwargs: Any) -> "MCPStackCore":
         """Extend the stack using a preset factory and return a new instance.
 
@@ -159,12 +209,10 @@ class MCPStackCore:
         """
         from MCPStack.core.preset.registry import ALL_PRESETS
 
-        if preset_name not in ALL_PRESETS:
-            available = list(ALL_PRESETS.keys())
-            best, score = process.extractOne(preset_name, available) or (None, 0)
-            suggestion = f" Did you mean '{best}'?" if score >= 80 else ""
+        preset_class = ALL_PRESETS.get(preset_name)
+        if preset_class is None:
+            suggestion = did_you_mean(preset_name, ALL_PRESETS.keys())
             raise MCPStackPresetError(f"Unknown preset: {preset_name}.{suggestion}")
-        preset_class = ALL_PRESETS[preset_name]
         config = kwargs.pop("config", self.config)
         preset_stack = preset_class.create(config=config, **kwargs)  # type: ignore
         merged_tools = self.tools + preset_stack.tools
@@ -172,6 +220,7 @@ class MCPStackCore:
         new.tools = merged_tools
         return new
 
+    @beartype
     def build(
         self,
         type: str = "fastmcp",
@@ -180,7 +229,7 @@ class MCPStackCore:
         cwd: Optional[str] = None,
         module_name: Optional[str] = None,
         pipeline_config_path: Optional[str] = None,
-        save_path: Optional[str] = None,
+        save_path: Optional[Union[str, os.PathLike]] = None,
     ) -> Union[dict, str]:
         """Validate, initialize, and register all tools; generate a config.
 
@@ -254,11 +303,16 @@ class MCPStackCore:
             self._teardown_tools()
             logger.info("MCP server shutdown complete.")
 
-    def save(self, path: str) -> None:
+    @beartype
+    def save(self, path: Union[str, os.PathLike]) -> None:
         """Serialize the stack (config + tools) to a JSON file.
 
+        The file uses two-space indentation and is encoded with `orjson` when
+        the `speedups` extra is installed. Tool entries are streamed to disk
+        one at a time, so only one tool's payload is held in memory at once.
+
         Args:
-            path: Filesystem path to write the JSON config.
+            path: Filesystem path (`str` or `os.PathLike`) to write the JSON config.
 
         Raises:
             MCPStackBuildError: If called before :meth:`build`.
@@ -283,26 +337,28 @@ class MCPStackCore:
         if not self._built:
             raise MCPStackBuildError("Call .build() before .save()")
 
-        data = {
-            "config": self.config.to_dict(),
-            "tools": [
+        dump_json_streamed(
+            path,
+            {"config": self.config.to_dict()},
+            "tools",
+            (
                 {
                     "type": tool.__class__.__name__.lower(),
                     "params": tool.to_dict(),
                 }
                 for tool in self.tools
-            ],
-        }
-        with open(path, "w") as f:
-            json.dump(data, f, indent=4)
+            ),
+        )
         logger.info(f"✅ Saved pipeline config to {path}.")
 
     @classmethod
-    def load(cls, path: str) -> "MCPStackCore":
+    @beartype
+    def load(cls, path: Union[str, os.PathLike]) -> "MCPStackCore":
         """Load a stack configuration previously written by :meth:`save`.
 
         Args:
-            path: Path to a JSON config file produced by :meth:`save`.
+            path: Path (`str` or `os.PathLike`) to a JSON config file produced
+                by :meth:`save`.
 
         Returns:
             MCPStackCore: A new stack instance reconstructed from the file.
@@ -310,7 +366,7 @@ class MCPStackCore:
         Raises:
             FileNotFoundError: If `path` doesn't exist.
             MCPStackValidationError: The file is malformed or references an
-                unknown tool type.
+                unknown tool type (with fuzzy suggestion).
 
         !!! tip "Post-load hooks"
             Each tool's `post_load()` is invoked to re-establish any backends
@@ -320,19 +376,25 @@ class MCPStackCore:
             If tool code changed since saving, ensure `from_dict` and
             `post_load` handle migration.
         """
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Config not found: {path}")
-        with open(path) as f:
-            data = json.load(f)
+        try:
+            data = load_json(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config not found: {path}") from None
+        from MCPStack.tools.registry import ALL_TOOLS
+
         config = StackConfig.from_dict(data["config"])
-        instance = cls(config=config)
+        tools = []
         for tool_data in data.get("tools", []):
             tool_type = tool_data["type"]
-            if tool_type not in ALL_TOOLS:
-                raise MCPStackValidationError(f"Unknown tool type: {tool_type}")
-            tool_cls = ALL_TOOLS[tool_type]
-            tool = tool_cls.from_dict(tool_data["params"])  # type: ignore
-            instance = instance.with_tool(tool)
+            tool_cls = ALL_TOOLS.get(tool_type)
+            if tool_cls is None:
+                suggestion = did_you_mean(tool_type, ALL_TOOLS.keys())
+                raise MCPStackValidationError(
+                    f"Unknown tool type: {tool_type}.{suggestion}"
+                )
+            tools.append(tool_cls.from_dict(tool_data["params"]))  # type: ignore
+        instance = cls(config=config)
+        instance.tools = tools
         instance._post_load()
         instance._built = True
         logger.info(f"Pipeline loaded from {path}")
@@ -350,6 +412,8 @@ class MCPStackCore:
             Sets `self.mcp` to a default :class:`FastMCP("mcpstack")` if `None`.
         """
         if not self.mcp:
+            from fastmcp import FastMCP
+
             self.mcp = FastMCP("mcpstack")
 
     def _initialize_tools(self) -> None:
@@ -369,12 +433,26 @@ class MCPStackCore:
         """Register all tool actions with the MCP server.
 
         Implementation detail:
-            Flattens `tool.actions()` across all tools and registers each
-            callable with `self.mcp.tool()` decorator.
+            Lazily chains `tool.actions()` (or a tool's precomputed
+            `_cached_actions`) across all tools and registers each callable
+            with the `self.mcp.tool()` decorator, looked up once.
+
+        !!! note "Idempotent"
+            Actions already registered by this stack are skipped, so calling
+            :meth:`build` and then `_post_load` (or either twice) does not
+            register them with FastMCP again. Bound methods compare equal per
+            tool instance, so re-fetching `tool.actions()` still matches.
         """
-        actions = [action for tool in self.tools for action in tool.actions()]
-        for action in actions:
-            self.mcp.tool()(action)  # type: ignore
+        register = self.mcp.tool  # type: ignore
+        registered = self._registered_actions
+        for action in chain.from_iterable(
+            getattr(tool, "_cached_actions", None) or tool.actions()
+            for tool in self.tools
+        ):
+            if action in registered:
+                continue
+            registered.add(action)
+            register()(action)
 
     def _generate_config(self, type: str, **kwargs) -> Union[dict, str]:
         """Generate an MCP host configuration via a registered generator.
@@ -394,32 +472,35 @@ class MCPStackCore:
             cfg = stack.build(type="fastmcp", save_path="mcp.json")
             ```
         """
-        if type not in self._mcp_config_generators:
-            available = list(self._mcp_config_generators.keys())
-            best, score = process.extractOne(type, available) or (None, 0)
-            suggestion = f" Did you mean '{best}'?" if score >= 80 else ""
+        generator_class = self._mcp_config_generators.get(type)
+        if generator_class is None:
+            suggestion = did_you_mean(type, self._mcp_config_generators.keys())
             raise MCPStackValidationError(f"Unknown config type: {type}.{suggestion}")
-        generator_class = self._mcp_config_generators[type]
         return generator_class.generate(self, **kwargs)  # type: ignore
 
     def _teardown_tools(self) -> None:
         """Best-effort teardown of tool backends after server shutdown.
 
         This traverses `tool.backends` (if present) and calls `backend.teardown()`
-        when available, ignoring exceptions to guarantee best-effort cleanup.
+        when available. Exceptions are logged at DEBUG and suppressed to
+        guarantee best-effort cleanup.
 
         !!! note "Why ignore exceptions?"
             Teardown should not mask or replace the primary error context during
             shutdown; tools are responsible for robust cleanup.
         """
         for tool in self.tools:
-            if hasattr(tool, "backends"):
-                for backend in getattr(tool, "backends", {}).values():
-                    try:
-                        if hasattr(backend, "teardown"):
-                            backend.teardown()
-                    except Exception:
-                        pass
+            backends = getattr(tool, "backends", None)
+            if not backends:
+                continue
+            for backend in backends.values():
+                teardown = getattr(backend, "teardown", None)
+                if teardown is None:
+                    continue
+                try:
+                    teardown()
+                except Exception:
+                    logger.debug("Backend teardown error", exc_info=True)
 
     def _post_load(self) -> None:
         """Finalize a stack created by :meth:`load`.
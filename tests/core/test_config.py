@@ -4,11 +4,25 @@ from unittest.mock import patch
 
 import pytest
 
-from MCPStack.core.config import StackConfig
+from MCPStack.core.config import StackConfig, _project_root
 from MCPStack.core.tool.base import BaseTool
 from MCPStack.core.utils.exceptions import MCPStackConfigError
 
 
+class EnvTool(BaseTool):
+    """Minimal concrete tool used to exercise env var validation."""
+
+    def actions(self):
+        return []
+
+    def to_dict(self):
+        return {}
+
+    @classmethod
+    def from_dict(cls, params):
+        return cls()
+
+
 @pytest.fixture
 def temp_env_vars():
     """Fixture to temporarily set environment variables."""
@@ -38,6 +52,13 @@ class TestStackConfig:
         assert config.log_level == "DEBUG"
         assert config.env_vars == env_vars
 
+    def test_init_copies_env_vars(self):
+        """Test the env mapping is copied rather than shared."""
+        env_vars = {"TEST_KEY": "value"}
+        config = StackConfig(env_vars=env_vars)
+        env_vars["OTHER_KEY"] = "other"
+        assert config.env_vars == {"TEST_KEY": "value"}
+
     def test_to_dict(self):
         """Test to_dict method."""
         config = StackConfig(env_vars={"KEY": "value"})
@@ -68,43 +89,19 @@ class TestStackConfig:
 
     def test_validate_for_tools_success(self):
         """Test validate_for_tools method success."""
-
-        class Tool(BaseTool):
-            def actions(self):
-                return []
-
-            def to_dict(self):
-                return {}
-
-            @classmethod
-            def from_dict(cls, params):
-                return cls()
-
-        mock_tool = Tool()
-        mock_tool.__class__.__name__ = "TestTool"
+        mock_tool = EnvTool()
         mock_tool.required_env_vars = {"REQUIRED": None}
         config = StackConfig(env_vars={"REQUIRED": "value"})
         config.validate_for_tools([mock_tool])
 
     def test_validate_for_tools_error(self):
         """Test validate_for_tools raises on error."""
-
-        class Tool(BaseTool):
-            def actions(self):
-                return []
-
-            def to_dict(self):
-                return {}
-
-            @classmethod
-            def from_dict(cls, params):
-                return cls()
-
-        mock_tool = Tool()
-        mock_tool.__class__.__name__ = "TestTool"
+        mock_tool = EnvTool()
         mock_tool.required_env_vars = {"FAKE_MISSING": None}
         config = StackConfig(env_vars={})
-        with pytest.raises(MCPStackConfigError):
+        with pytest.raises(
+            MCPStackConfigError, match="EnvTool: Missing required env var: FAKE_MISSING"
+        ):
             config.validate_for_tools([mock_tool])
 
     def test_merge_env(self):
@@ -125,9 +122,13 @@ class TestStackConfig:
     def test_project_root_fallback(self, mock_home):
         """Test project root fallback to home."""
         mock_home.return_value = Path("/home/user")
-        with patch("pathlib.Path.exists", return_value=False):
-            config = StackConfig()
-            assert config.project_root == Path("/home/user")
+        _project_root.cache_clear()
+        try:
+            with patch("pathlib.Path.exists", return_value=False):
+                config = StackConfig()
+                assert config.project_root == Path("/home/user")
+        finally:
+            _project_root.cache_clear()
 
     def test_invalid_log_level(self):
         """Test invalid log level raises error."""
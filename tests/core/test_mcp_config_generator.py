@@ -1,23 +1,32 @@
+import json
 import os
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from MCPStack.core.config import StackConfig
 from MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config import (
     ClaudeConfigGenerator,
+    _claude_config_path,
 )
 from MCPStack.core.mcp_config_generator.mcp_config_generators.fast_mcp_config import (
     FastMCPConfigGenerator,
 )
+from MCPStack.core.mcp_config_generator.mcp_config_generators.universal_mcp_config import (
+    UniversalConfigGenerator,
+)
 from MCPStack.core.utils.exceptions import MCPStackValidationError
 from MCPStack.stack import MCPStackCore
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_stack() -> MCPStackCore:
-    """Fixture for mock MCPStack instance."""
+    """Fixture for mock MCPStack instance.
+
+    Module-scoped: the generators only read from the stack.
+    """
     config = StackConfig(env_vars={"TEST_ENV": "value"})
     return MCPStackCore(config=config)
 
@@ -25,7 +34,7 @@ def mock_stack() -> MCPStackCore:
 class TestClaudeConfigGenerator:
     """Tests for ClaudeConfigGenerator."""
 
-    @patch("shutil.which", return_value="/usr/bin/python")
+    @patch("shutil.which", return_value=sys.executable)
     @patch("os.path.isdir", return_value=True)
     @patch(
         "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.ClaudeConfigGenerator._get_claude_config_path"
@@ -49,6 +58,25 @@ class TestClaudeConfigGenerator:
         assert os.path.isdir(server["cwd"])
         assert "TEST_ENV" in server["env"]
 
+    @patch("shutil.which", return_value=sys.executable)
+    @patch("os.path.isdir", return_value=True)
+    def test_pipeline_config_path_does_not_mutate_stack(
+        self,
+        mock_isdir: MagicMock,
+        mock_which: MagicMock,
+        mock_stack: MCPStackCore,
+        tmp_path: Path,
+    ) -> None:
+        """Test the pipeline path is added to the config env, not the stack's."""
+        config = ClaudeConfigGenerator.generate(
+            mock_stack,
+            pipeline_config_path="pipeline.json",
+            save_path=str(tmp_path / "claude.json"),
+        )
+        env = config["mcpServers"]["mcpstack"]["env"]
+        assert env == {"TEST_ENV": "value", "MCPSTACK_CONFIG_PATH": "pipeline.json"}
+        assert "MCPSTACK_CONFIG_PATH" not in mock_stack.config.env_vars
+
     @patch("shutil.which", return_value=None)
     def test_invalid_command_raises_error(
         self, mock_which: MagicMock, mock_stack: MCPStackCore
@@ -65,53 +93,164 @@ class TestClaudeConfigGenerator:
         with pytest.raises(MCPStackValidationError, match="Invalid cwd"):
             ClaudeConfigGenerator.generate(mock_stack, cwd="/invalid/dir")
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.load")
-    @patch("json.dump")
     @patch(
         "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.ClaudeConfigGenerator._get_claude_config_path"
     )
-    @patch("pathlib.Path.exists")
     def test_merge_with_existing_config(
         self,
-        mock_exists: MagicMock,
         mock_get_path: MagicMock,
-        mock_dump: MagicMock,
-        mock_load: MagicMock,
-        mock_open_file: MagicMock,
         mock_stack: MCPStackCore,
         tmp_path: Path,
     ) -> None:
         """Test merging with existing Claude config."""
         mock_path = tmp_path / "claude_config.json"
+        mock_path.write_text(json.dumps({"mcpServers": {"existing": {}}}))
         mock_get_path.return_value = mock_path
-        mock_exists.return_value = True
-        mock_load.return_value = {"mcpServers": {"existing": {}}}
         _config = ClaudeConfigGenerator.generate(mock_stack)
-        mock_dump.assert_called_once()
-        dumped_config = mock_dump.call_args[0][0]
+        dumped_config = json.loads(mock_path.read_text())
         assert "existing" in dumped_config["mcpServers"]
         assert "mcpstack" in dumped_config["mcpServers"]
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
-    def test_save_to_custom_path(
+    @patch(
+        "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.ClaudeConfigGenerator._get_claude_config_path"
+    )
+    def test_merge_without_mcp_servers_key(
+        self,
+        mock_get_path: MagicMock,
+        mock_stack: MCPStackCore,
+        tmp_path: Path,
+    ) -> None:
+        """Test merging into a Claude config that has no mcpServers yet."""
+        mock_path = tmp_path / "claude_config.json"
+        mock_path.write_text(json.dumps({"theme": "dark"}))
+        mock_get_path.return_value = mock_path
+        config = ClaudeConfigGenerator.generate(mock_stack)
+        assert json.loads(mock_path.read_text()) == {"theme": "dark", **config}
+
+    @patch(
+        "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.ClaudeConfigGenerator._get_claude_config_path"
+    )
+    def test_merge_replaces_longer_entry(
         self,
+        mock_get_path: MagicMock,
+        mock_stack: MCPStackCore,
+        tmp_path: Path,
+    ) -> None:
+        """Test a shorter merged config leaves no trailing bytes behind."""
+        mock_path = tmp_path / "claude_config.json"
+        stale = {"mcpServers": {"mcpstack": {"command": "x" * 4096}}}
+        mock_path.write_text(json.dumps(stale))
+        mock_get_path.return_value = mock_path
+        config = ClaudeConfigGenerator.generate(mock_stack)
+        assert json.loads(mock_path.read_text()) == config
+
+    @patch(
+        "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.dump_json"
+    )
+    @patch(
+        "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.ClaudeConfigGenerator._get_claude_config_path"
+    )
+    def test_merge_skips_unchanged_config(
+        self,
+        mock_get_path: MagicMock,
         mock_dump: MagicMock,
-        mock_open_file: MagicMock,
+        mock_stack: MCPStackCore,
+        tmp_path: Path,
+    ) -> None:
+        """Test the Claude config is not rewritten when the entry is unchanged."""
+        mock_path = tmp_path / "claude_config.json"
+        mock_get_path.return_value = mock_path
+        mock_dump.side_effect = lambda obj, path: Path(path).write_text(json.dumps(obj))
+        ClaudeConfigGenerator.generate(mock_stack)
+        ClaudeConfigGenerator.generate(mock_stack)
+        mock_dump.assert_called_once()
+
+    @patch(
+        "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.ClaudeConfigGenerator._get_claude_config_path"
+    )
+    def test_merge_reuses_parsed_config_until_file_changes(
+        self,
+        mock_get_path: MagicMock,
+        mock_stack: MCPStackCore,
+        tmp_path: Path,
+    ) -> None:
+        """Test an unchanged Claude config is parsed once across repeat merges."""
+        mock_path = tmp_path / "claude_config.json"
+        mock_path.write_text(json.dumps({"mcpServers": {"existing": {}}}))
+        mock_get_path.return_value = mock_path
+        with patch(
+            "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.loads_json",
+            side_effect=json.loads,
+        ) as mock_loads:
+            ClaudeConfigGenerator.generate(mock_stack)
+            ClaudeConfigGenerator.generate(mock_stack)
+            assert mock_loads.call_count == 1
+            mock_path.write_text(json.dumps({"mcpServers": {"other": {}}}))
+            ClaudeConfigGenerator.generate(mock_stack)
+            assert mock_loads.call_count == 2
+        servers = json.loads(mock_path.read_text())["mcpServers"]
+        assert set(servers) == {"other", "mcpstack"}
+
+    def test_save_to_custom_path(
+        self,
         mock_stack: MCPStackCore,
         tmp_path: Path,
     ) -> None:
         """Test saving to custom path."""
         save_path = tmp_path / "custom.json"
-        config = ClaudeConfigGenerator.generate(mock_stack, save_path=str(save_path))
-        mock_dump.assert_called_once_with(config, mock_open_file(), indent=2)
+        config = ClaudeConfigGenerator.generate(mock_stack, save_path=save_path)
+        assert json.loads(save_path.read_text()) == config
+
+    def test_claude_config_path_is_cached(self, tmp_path: Path) -> None:
+        """Test the Claude config path lookup is resolved once per process."""
+        (tmp_path / ".config" / "Claude").mkdir(parents=True)
+        _claude_config_path.cache_clear()
+        try:
+            with patch("pathlib.Path.home", return_value=tmp_path) as mock_home:
+                first = ClaudeConfigGenerator._get_claude_config_path()
+                second = ClaudeConfigGenerator._get_claude_config_path()
+            assert (
+                first == tmp_path / ".config" / "Claude" / "claude_desktop_config.json"
+            )
+            assert second is first
+            mock_home.assert_called_once()
+        finally:
+            _claude_config_path.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("platform", "relative"),
+        [
+            ("darwin", ("Library", "Application Support", "Claude")),
+            ("win32", ("AppData", "Roaming", "Claude")),
+            ("linux", (".config", "Claude")),
+        ],
+    )
+    def test_claude_config_path_per_platform(
+        self, platform: str, relative: tuple, tmp_path: Path
+    ) -> None:
+        """Test only the current platform's Claude config location is used."""
+        for other in (
+            ("Library", "Application Support", "Claude"),
+            (".config", "Claude"),
+        ):
+            tmp_path.joinpath(*other).mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(*relative).mkdir(parents=True, exist_ok=True)
+        _claude_config_path.cache_clear()
+        try:
+            with (
+                patch("pathlib.Path.home", return_value=tmp_path),
+                patch("sys.platform", platform),
+            ):
+                path = ClaudeConfigGenerator._get_claude_config_path()
+            assert path == tmp_path.joinpath(*relative, "claude_desktop_config.json")
+        finally:
+            _claude_config_path.cache_clear()
 
 
 class TestFastMCPConfigGenerator:
     """Tests for FastMCPConfigGenerator."""
 
-    @patch("shutil.which", return_value="/usr/bin/python")
+    @patch("shutil.which", return_value=sys.executable)
     @patch("os.path.isdir", return_value=True)
     def test_generate_with_defaults(
         self, mock_isdir: MagicMock, mock_which: MagicMock, mock_stack: MCPStackCore
@@ -135,6 +274,15 @@ class TestFastMCPConfigGenerator:
         with pytest.raises(MCPStackValidationError, match="Invalid command"):
             FastMCPConfigGenerator.generate(mock_stack, command="/invalid/python")
 
+    @patch("shutil.which")
+    def test_absolute_command_skips_path_lookup(
+        self, mock_which: MagicMock, mock_stack: MCPStackCore
+    ) -> None:
+        """Test an absolute command is checked directly, without searching PATH."""
+        config = FastMCPConfigGenerator.generate(mock_stack, command=sys.executable)
+        assert config["mcpServers"]["mcpstack"]["command"] == sys.executable
+        mock_which.assert_not_called()
+
     @patch("os.path.isdir", return_value=False)
     def test_invalid_cwd_raises_error(
         self, mock_isdir: MagicMock, mock_stack: MCPStackCore
@@ -143,16 +291,30 @@ class TestFastMCPConfigGenerator:
         with pytest.raises(MCPStackValidationError, match="Invalid cwd"):
             FastMCPConfigGenerator.generate(mock_stack, cwd="/invalid/dir")
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
     def test_save_to_custom_path(
         self,
-        mock_dump: MagicMock,
-        mock_open_file: MagicMock,
         mock_stack: MCPStackCore,
         tmp_path: Path,
     ) -> None:
         """Test saving to custom path."""
         save_path = tmp_path / "custom.json"
-        config = FastMCPConfigGenerator.generate(mock_stack, save_path=str(save_path))
-        mock_dump.assert_called_once_with(config, mock_open_file(), indent=2)
+        config = FastMCPConfigGenerator.generate(mock_stack, save_path=save_path)
+        assert json.loads(save_path.read_text()) == config
+
+
+class TestUniversalConfigGenerator:
+    """Tests for UniversalConfigGenerator."""
+
+    def test_save_to_custom_path(
+        self,
+        mock_stack: MCPStackCore,
+        tmp_path: Path,
+    ) -> None:
+        """Test only serializable stack state is projected and saved."""
+        save_path = tmp_path / "universal.json"
+        config = UniversalConfigGenerator.generate(
+            mock_stack, pipeline_config_path="pipeline.json", save_path=save_path
+        )
+        assert set(config) == {"config", "tools", "env_vars"}
+        assert config["env_vars"]["MCPSTACK_CONFIG_PATH"] == "pipeline.json"
+        assert json.loads(save_path.read_text()) == config
@@ -0,0 +1,100 @@
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from MCPStack.core.utils import serialization
+from MCPStack.core.utils.serialization import dump_json, dump_json_streamed, load_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (if installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+class TestSerialization:
+    """Tests for the JSON serialization helpers."""
+
+    def test_round_trip(self, backend, tmp_path: Path):
+        """Test dump_json output is read back unchanged by load_json."""
+        path = tmp_path / "data.json"
+        payload = {"mcpServers": {"mcpstack": {"args": ["-m", "x"], "env": {}}}}
+        dump_json(payload, path)
+        assert load_json(path) == payload
+        assert json.loads(path.read_text()) == payload
+
+    def test_dump_indent(self, backend, tmp_path: Path):
+        """Test the default two-space indentation matches json.dumps."""
+        path = tmp_path / "data.json"
+        payload = {"a": [1, 2], "b": "👋"}
+        dump_json(payload, path)
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            payload, indent=2, ensure_ascii=False
+        )
+
+    def test_dump_non_str_keys(self, backend, tmp_path: Path):
+        """Test int keys are written as strings by either backend."""
+        path = tmp_path / "data.json"
+        dump_json({"a": {1: "x", 2: "y"}}, path)
+        assert load_json(path) == {"a": {"1": "x", "2": "y"}}
+
+    def test_load_invalid_json(self, backend, tmp_path: Path):
+        """Test malformed input raises a json.JSONDecodeError subclass."""
+        path = tmp_path / "bad.json"
+        path.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(path)
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_dump_json_streamed_matches_dump_json(
+        self, backend, tmp_path: Path, count: int
+    ):
+        """Test streamed output is byte-identical to a one-shot dump."""
+        fields = {"config": {"log_level": "INFO", "env_vars": {"A": "line\nbreak"}}}
+        items = [{"type": f"tool{i}", "params": {"n": [i, {}]}} for i in range(count)]
+        streamed, whole = tmp_path / "streamed.json", tmp_path / "whole.json"
+        dump_json_streamed(streamed, fields, "tools", iter(items))
+        dump_json({**fields, "tools": items}, whole)
+        assert streamed.read_bytes() == whole.read_bytes()
+
+    def test_dump_json_streamed_failure_keeps_file(self, backend, tmp_path: Path):
+        """Test a failing item leaves the previous file and no temp file behind."""
+        path = tmp_path / "data.json"
+        path.write_bytes(b"{}")
+
+        def items():
+            yield {"ok": 1}
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            dump_json_streamed(path, {}, "tools", items())
+        assert path.read_bytes() == b"{}"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_dump_json_streamed_keeps_mode(self, backend, tmp_path: Path):
+        """Test replacing an existing file keeps its permission bits."""
+        path = tmp_path / "data.json"
+        path.write_bytes(b"{}")
+        path.chmod(0o600)
+        dump_json_streamed(path, {}, "tools", iter([{"ok": 1}]))
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert load_json(path) == {"tools": [{"ok": 1}]}
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+    def test_dump_json_streamed_follows_symlink(self, backend, tmp_path: Path):
+        """Test saving through a symlink updates the target and keeps the link."""
+        target = tmp_path / "data.json"
+        target.write_bytes(b"{}")
+        link = tmp_path / "link.json"
+        os.symlink(target, link)
+        dump_json_streamed(link, {}, "tools", iter([{"ok": 1}]))
+        assert link.is_symlink()
+        assert load_json(target) == {"tools": [{"ok": 1}]}
@@ -0,0 +1,26 @@
+import pytest
+
+from MCPStack.core.utils.suggestions import did_you_mean
+
+
+class TestDidYouMean:
+    """Tests for the shared unknown-name suggestion helper."""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("fastmc", " Did you mean 'fastmcp'?"),
+            ("my_custom_presett", " Did you mean 'my_custom_preset'?"),
+            ("exaple_preset", " Did you mean 'example_preset'?"),
+            ("zzzz", ""),
+            ("", ""),
+        ],
+    )
+    def test_suggestion(self, name: str, expected: str):
+        """Test prefix, fuzzy, and no-match cases."""
+        available = {"fastmcp": 1, "example_preset": 2, "my_custom_preset": 3}
+        assert did_you_mean(name, available.keys()) == expected
+
+    def test_empty_registry(self):
+        """Test an empty registry yields no hint."""
+        assert did_you_mean("fastmcp", ()) == ""
@@ -1,10 +1,14 @@
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 import MCPStack.core.preset.registry as preset_registry
 from MCPStack.cli import StackCLI
 from MCPStack.core.config import StackConfig
+from MCPStack.stack import MCPStackCore
 
 runner = CliRunner()
 app = StackCLI().app
@@ -34,9 +38,9 @@ class TestMCPStackCLI:
         assert result.exit_code == 0
         assert "Available Tools" in result.stdout
 
-    @patch("MCPStack.cli.MCPStackCore.run")
-    @patch("MCPStack.cli.MCPStackCore.build")
-    @patch("MCPStack.cli.MCPStackCore.save")
+    @patch("MCPStack.stack.MCPStackCore.run")
+    @patch("MCPStack.stack.MCPStackCore.build")
+    @patch("MCPStack.stack.MCPStackCore.save")
     def test_run_with_preset(
         self, mock_save: MagicMock, mock_build: MagicMock, mock_run: MagicMock
     ) -> None:
@@ -64,6 +68,20 @@ class TestMCPStackCLI:
         assert result.exit_code == 0
         assert "Presets matches" in result.stdout
 
+    def test_search_sees_runtime_presets(self) -> None:
+        runner.invoke(app, ["search", "example", "--type", "presets"])
+        with patch.dict(preset_registry.ALL_PRESETS, {"my_custom_preset": MagicMock()}):
+            result = runner.invoke(app, ["search", "my_custom", "--type", "presets"])
+            assert "my_custom_preset" in result.stdout
+            result = runner.invoke(app, ["run", "--presets", "my_custom_presett"])
+        assert result.exit_code != 0
+        assert "'my_custom_preset'?" in _strip_ansi(result.output)
+
+    def test_search_below_cutoff(self) -> None:
+        result = runner.invoke(app, ["search", "zzzz", "--type", "tools"])
+        assert result.exit_code == 0
+        assert "no matches" in result.stdout
+
     def test_search_invalid_type(self) -> None:
         result = runner.invoke(app, ["search", "query", "--type", "invalid"])
         assert result.exit_code != 0
@@ -80,10 +98,19 @@ class TestMCPStackCLI:
         output = _strip_ansi(result.output)
         assert "Unknown preset" in output
 
-    @patch("MCPStack.cli.MCPStackCore.load")
+    def test_run_with_one_invalid_preset_in_list(self) -> None:
+        result = runner.invoke(
+            app, ["run", "--presets", "example_preset,exaple_preset"]
+        )
+        assert result.exit_code != 0
+        output = _strip_ansi(result.output)
+        assert "Unknown preset: exaple_preset" in output
+        assert "Applying preset" not in output
+
+    @patch("MCPStack.stack.MCPStackCore.load")
     def test_build_success_fastmcp(self, mock_load: MagicMock) -> None:
         # Build with default config type; use existing pipeline path scenario
-        mock_stack = MagicMock()
+        mock_stack = MagicMock(spec=MCPStackCore)
         mock_load.return_value = mock_stack
         result = runner.invoke(
             app, ["build", "--config-type", "fastmcp", "--pipeline", "some.json"]
@@ -91,25 +118,52 @@ class TestMCPStackCLI:
         # build subcommand should succeed (it catches exceptions and exits 1 otherwise)
         assert result.exit_code == 0
 
-    @patch(
-        "MCPStack.core.mcp_config_generator.mcp_config_generators.claude_mcp_config.ClaudeConfigGenerator.generate"
+    @pytest.mark.parametrize(
+        ("config_type", "generator"),
+        [
+            ("claude", "claude_mcp_config.ClaudeConfigGenerator"),
+            ("universal", "universal_mcp_config.UniversalConfigGenerator"),
+        ],
     )
-    def test_build_success_claude(self, mock_generate: MagicMock) -> None:
-        mock_generate.return_value = {"mcpServers": {"mcpstack": {}}}
-        result = runner.invoke(app, ["build", "--config-type", "claude"])
+    def test_build_success(
+        self,
+        config_type: str,
+        generator: str,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            f"MCPStack.core.mcp_config_generator.mcp_config_generators.{generator}.generate",
+            return_value={"mcpServers": {"mcpstack": {}}},
+        ):
+            result = runner.invoke(app, ["build", "--config-type", config_type])
         assert result.exit_code == 0
         output = _strip_ansi(result.stdout)
         assert "Pipeline config saved" in output
+        assert (tmp_path / "mcpstack_pipeline.json").exists()
 
-    @patch(
-        "MCPStack.core.mcp_config_generator.mcp_config_generators.universal_mcp_config.UniversalConfigGenerator.generate"
-    )
-    def test_build_success_universal(self, mock_generate: MagicMock) -> None:
-        mock_generate.return_value = {"mcpServers": {"mcpstack": {}}}
-        result = runner.invoke(app, ["build", "--config-type", "universal"])
-        assert result.exit_code == 0
-        output = _strip_ansi(result.stdout)
-        assert "Pipeline config saved" in output
+    def test_build_records_required_env_from_shell(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("MCP_HELLO_PREFIX", "from-shell")
+        output = tmp_path / "claude.json"
+        result = runner.invoke(
+            app,
+            [
+                "build",
+                "--presets",
+                "example_preset",
+                "--config-type",
+                "claude",
+                "--output",
+                str(output),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        server = json.loads(output.read_bytes())["mcpServers"]["mcpstack"]
+        assert server["env"]["MCP_HELLO_PREFIX"] == "from-shell"
 
     @patch(
         "MCPStack.core.mcp_config_generator.mcp_config_generators.fast_mcp_config.FastMCPConfigGenerator.generate"
@@ -1,4 +1,6 @@
 import json
+import logging
+import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,8 +18,11 @@ from MCPStack.core.utils.exceptions import (
     MCPStackValidationError,
 )
 from MCPStack.stack import MCPStackCore
+from MCPStack.tools.hello_world import Hello_World
 from MCPStack.tools.registry import ALL_TOOLS
 
+_NOT_BUILT = re.compile(re.escape("Call .build()"))
+
 
 @pytest.fixture
 def mock_config() -> StackConfig:
@@ -89,6 +94,16 @@ class TestMCPStackCore:
         assert new_stack.config == stack.config
         assert new_stack.mcp == stack.mcp
 
+    def test_with_tool_chain_keeps_branches_independent(self) -> None:
+        tools = [MagicMock(spec=BaseTool) for _ in range(4)]
+        base = MCPStackCore().with_tool(tools[0])
+        left = base.with_tools(tools[1:3])
+        right = base.with_tool(tools[3])
+        assert left.tools == tools[:3]
+        assert right.tools == [tools[0], tools[3]]
+        assert base.tools == [tools[0]]
+        assert base.with_tool(tools[1]).tools == tools[:2]
+
     @patch("MCPStack.core.preset.registry.ALL_PRESETS", {"test_preset": MagicMock()})
     def test_with_preset_success(self) -> None:
         mock_preset_class = MagicMock()
@@ -113,6 +128,11 @@ class TestMCPStackCore:
         with pytest.raises(MCPStackPresetError, match="Unknown preset"):
             stack.with_preset("unknown")
 
+    def test_with_preset_unknown_with_suggestion(self) -> None:
+        stack = MCPStackCore()
+        with pytest.raises(MCPStackPresetError, match="Did you mean 'example_preset'"):
+            stack.with_preset("exaple_preset")
+
     def test_build_success(self, mock_tool: BaseTool) -> None:
         with patch.dict(ALL_MCP_CONFIG_GENERATORS, {"test": MagicMock()}):
             mock_generator = ALL_MCP_CONFIG_GENERATORS["test"]
@@ -144,7 +164,7 @@ class TestMCPStackCore:
 
     def test_run_not_built(self) -> None:
         stack = MCPStackCore()
-        with pytest.raises(MCPStackBuildError, match="Call .build()"):
+        with pytest.raises(MCPStackBuildError, match=_NOT_BUILT):
             stack.run()
 
     def test_run_no_mcp(self) -> None:
@@ -157,7 +177,7 @@ class TestMCPStackCore:
         mock_mcp = MagicMock(spec=FastMCP)
         stack = MCPStackCore(mcp=mock_mcp).with_tool(mock_tool)
         stack._built = True
-        with patch.object(stack, "_teardown_tools") as mock_teardown:
+        with patch.object(MCPStackCore, "_teardown_tools") as mock_teardown:
             stack.run()
             mock_mcp.run.assert_called_once()
             mock_teardown.assert_called_once()
@@ -167,41 +187,56 @@ class TestMCPStackCore:
         mock_mcp.run.side_effect = Exception("Run failed")
         stack = MCPStackCore(mcp=mock_mcp).with_tool(mock_tool)
         stack._built = True
-        with patch.object(stack, "_teardown_tools") as mock_teardown:
+        with patch.object(MCPStackCore, "_teardown_tools") as mock_teardown:
             with pytest.raises(Exception, match="Run failed"):
                 stack.run()
             mock_teardown.assert_called_once()
 
     def test_save_not_built(self) -> None:
         stack = MCPStackCore()
-        with pytest.raises(MCPStackBuildError, match="Call .build()"):
+        with pytest.raises(MCPStackBuildError, match=_NOT_BUILT):
             stack.save("test.json")
 
     def test_save_success(self, tmp_path: Path, mock_tool: BaseTool) -> None:
         path = tmp_path / "config.json"
         stack = MCPStackCore().with_tool(mock_tool)
         stack._built = True
-        stack.save(str(path))
+        stack.save(path)
         assert path.exists()
-        with open(path) as f:
-            data = json.load(f)
+        data = json.loads(path.read_bytes())
         assert "config" in data
         assert "tools" in data
         assert len(data["tools"]) == 1
 
+    def test_save_failure_keeps_existing_file(
+        self, tmp_path: Path, mock_tool: BaseTool
+    ) -> None:
+        path = tmp_path / "config.json"
+        stack = MCPStackCore().with_tool(mock_tool)
+        stack._built = True
+        stack.save(path)
+        original = path.read_bytes()
+
+        broken = MagicMock(spec=BaseTool)
+        broken.to_dict.side_effect = RuntimeError("to_dict failed")
+        stack.tools = [mock_tool, broken]
+        with pytest.raises(RuntimeError, match="to_dict failed"):
+            stack.save(path)
+        assert path.read_bytes() == original
+        assert list(tmp_path.iterdir()) == [path]
+
     def test_load_success(self, tmp_path: Path) -> None:
         path = tmp_path / "config.json"
         data = {
             "config": {"log_level": "INFO", "env_vars": {}},
             "tools": [{"type": "mocktool", "params": {"param": "value"}}],
         }
-        with open(path, "w") as f:
-            json.dump(data, f)
+        path.write_text(json.dumps(data))
         with patch.dict(ALL_TOOLS, {"mocktool": MagicMock()}):
             mock_tool_cls = ALL_TOOLS["mocktool"]
             mock_tool = MagicMock(spec=BaseTool)
             mock_tool_cls.from_dict.return_value = mock_tool
-            stack = MCPStackCore.load(str(path))
+            stack = MCPStackCore.load(path)
             assert isinstance(stack, MCPStackCore)
             assert stack._built
             mock_tool.post_load.assert_called_once()
@@ -216,10 +251,24 @@ class TestMCPStackCore:
             "config": {"log_level": "INFO", "env_vars": {}},
             "tools": [{"type": "unknown", "params": {}}],
         }
-        with open(path, "w") as f:
-            json.dump(data, f)
+        path.write_text(json.dumps(data))
         with pytest.raises(MCPStackValidationError, match="Unknown tool type"):
-            MCPStackCore.load(str(path))
+            MCPStackCore.load(path)
+
+    def test_load_unknown_tool_with_suggestion(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.json"
+        data = {
+            "config": {"log_level": "INFO", "env_vars": {}},
+            "tools": [{"type": "helo_world", "params": {}}],
+        }
+        path.write_text(json.dumps(data))
+        with pytest.raises(
+            MCPStackValidationError,
+            match=re.escape(
+                "Unknown tool type: helo_world. Did you mean 'hello_world'"
+            ),
+        ):
+            MCPStackCore.load(path)
 
     def test_teardown_tools(self, mock_tool: BaseTool) -> None:
         mock_backend = MagicMock()
@@ -228,6 +277,36 @@ class TestMCPStackCore:
         stack._teardown_tools()
         mock_backend.teardown.assert_called_once()
 
+    def test_teardown_tools_continues_after_failure(
+        self, mock_tool: BaseTool, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        failing, healthy = MagicMock(), MagicMock()
+        failing.teardown.side_effect = RuntimeError("boom")
+        mock_tool.backends = {"failing": failing, "healthy": healthy}
+        stack = MCPStackCore().with_tool(mock_tool)
+        with caplog.at_level(logging.DEBUG, logger="MCPStack.stack"):
+            stack._teardown_tools()
+        healthy.teardown.assert_called_once()
+        assert "Backend teardown error" in caplog.text
+
+    def test_register_actions_is_idempotent(self) -> None:
+        mock_mcp = MagicMock(spec=FastMCP)
+        mock_mcp.tool.return_value = lambda x: x
+        tool = Hello_World()
+        stack = MCPStackCore(mcp=mock_mcp).with_tool(tool)
+        stack._register_actions()
+        stack._register_actions()
+        assert mock_mcp.tool.call_count == len(tool.actions())
+
+    def test_register_actions_prefers_cached_actions(self, mock_tool: BaseTool) -> None:
+        mock_mcp = MagicMock(spec=FastMCP)
+        mock_mcp.tool.return_value = lambda x: x
+        mock_tool._cached_actions = [lambda: "cached"]
+        stack = MCPStackCore(mcp=mock_mcp).with_tool(mock_tool)
+        stack._register_actions()
+        mock_tool.actions.assert_not_called()
+        mock_mcp.tool.assert_called_once()
+
     def test_post_load(self, mock_tool: BaseTool) -> None:
         stack = MCPStackCore().with_tool(mock_tool)
         stack._post_load()